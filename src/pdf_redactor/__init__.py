@@ -13,6 +13,42 @@ Or run the GUI::
     python -m pdf_redactor
 """
 
-from pdf_redactor.redactor import RedactionResult, parse_terms, redact_pdf
+from __future__ import annotations
 
-__all__ = ["RedactionResult", "parse_terms", "redact_pdf"]
+from typing import TYPE_CHECKING, Any
+
+from pdf_redactor.terms import parse_terms
+
+if TYPE_CHECKING:
+    from pdf_redactor.redactor import (
+        RedactionCancelled,
+        RedactionResult,
+        RedactOptions,
+        clear_page_cache,
+        redact_pdf,
+    )
+
+__all__ = [
+    "RedactionCancelled",
+    "RedactionResult",
+    "RedactOptions",
+    "clear_page_cache",
+    "parse_terms",
+    "redact_pdf",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the engine (and with it PyMuPDF) on first use rather than at
+    # package import, so ``python -m pdf_redactor`` shows its window sooner.
+    if name in __all__:
+        from pdf_redactor import redactor
+
+        value = getattr(redactor, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,88 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""Compiled Aho-Corasick scan for the redaction engine.
+
+Optional accelerator for the pure-Python automaton in ``redactor.py``, used
+when ``pyahocorasick`` is not installed. The automaton is passed in as flat
+integer tables built by ``_TermAutomaton._compile_tables``:
+
+* ``cmap`` maps each BMP code point to its character id (``0`` for characters
+  that occur in no term); ``wide`` does the same for code points above
+  U+FFFF.
+* ``edge_start[s]:edge_start[s + 1]`` is the slice of ``edge_char`` /
+  ``edge_next`` holding state ``s``'s transitions, sorted by character id.
+* ``fail`` holds the failure link of each state.
+* ``out_start[s]:out_start[s + 1]`` is the slice of ``out_index`` listing the
+  term indices matched on entering state ``s``.
+* ``lengths`` holds each term's length.
+"""
+
+
+cdef inline int _step(
+    int state,
+    int cid,
+    const int[:] edge_start,
+    const int[:] edge_char,
+    const int[:] edge_next,
+) noexcept nogil:
+    """Return the goto transition of ``state`` on ``cid``, or -1 if none."""
+    cdef int lo = edge_start[state]
+    cdef int hi = edge_start[state + 1]
+    cdef int mid
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if edge_char[mid] < cid:
+            lo = mid + 1
+        elif edge_char[mid] > cid:
+            hi = mid
+        else:
+            return edge_next[mid]
+    return -1
+
+
+def scan(
+    str text,
+    const int[:] cmap,
+    dict wide,
+    const int[:] edge_start,
+    const int[:] edge_char,
+    const int[:] edge_next,
+    const int[:] fail,
+    const int[:] out_start,
+    const int[:] out_index,
+    const int[:] lengths,
+):
+    """Return ``(start, end, term_index)`` for every match in ``text``.
+
+    ``text`` must already be folded; ``end`` is exclusive.
+    """
+    cdef list matches = []
+    cdef Py_ssize_t pos = 0
+    cdef Py_UCS4 ch
+    cdef int state = 0
+    cdef int cid, nxt, k, index
+
+    for ch in text:
+        if ch < 65536:
+            cid = cmap[ch]
+        else:
+            cid = wide.get(<int>ch, 0)
+
+        if cid == 0:
+            # No term contains this character, so every match restarts.
+            state = 0
+        else:
+            while True:
+                nxt = _step(state, cid, edge_start, edge_char, edge_next)
+                if nxt >= 0:
+                    state = nxt
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+
+        for k in range(out_start[state], out_start[state + 1]):
+            index = out_index[k]
+            matches.append((pos + 1 - lengths[index], pos + 1, index))
+        pos += 1
+
+    return matches
@@ -9,10 +9,16 @@ import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
+from typing import TYPE_CHECKING
 
 import customtkinter as ctk
 
-from pdf_redactor.redactor import RedactionResult, parse_terms, redact_pdf
+from pdf_redactor.terms import parse_terms
+
+if TYPE_CHECKING:
+    # The engine pulls in PyMuPDF; it is imported on first use instead so the
+    # window can appear without waiting for it.
+    from pdf_redactor.redactor import RedactionResult
 
 # ── Appearance ─────────────────────────────────────────────────────────────────
 ctk.set_appearance_mode("dark")
@@ -34,6 +40,7 @@ class RedactorApp(ctk.CTk):
     """Main application window."""
 
     _PAD = 22
+    _POLL_MS = 100   # progress refresh interval while redacting
 
     def __init__(self) -> None:
         super().__init__()
@@ -45,8 +52,16 @@ class RedactorApp(ctk.CTk):
 
         self._is_running = False
         self._input_path = tk.StringVar()
+        self._progress_var = tk.DoubleVar(value=0.0)
+        # (current, total) written by the worker thread, read by _poll_progress
+        self._progress_state: tuple[int, int] | None = None
+        # Pending ``after`` id of the _poll_progress chain, if one is scheduled
+        self._poll_id: str | None = None
+        self._worker: threading.Thread | None = None
+        self._cancel_event = threading.Event()
 
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ── UI construction ────────────────────────────────────────────────────────
 
@@ -180,14 +195,27 @@ class RedactorApp(ctk.CTk):
 
         self._progress = ctk.CTkProgressBar(
             self._prog_frame,
+            variable=self._progress_var,
             height=6,
             fg_color=_DIM,
             progress_color=_RED,
             corner_radius=3,
         )
-        self._progress.pack(fill="x", padx=p, pady=(5, p))
+        self._progress.pack(fill="x", padx=p, pady=(5, 10))
         self._progress.set(0)
 
+        self._cancel_btn = ctk.CTkButton(
+            self._prog_frame,
+            text="Cancel",
+            height=32,
+            fg_color=_DIM,
+            hover_color="#505050",
+            text_color=_TEXT,
+            font=ctk.CTkFont(size=12),
+            corner_radius=6,
+            command=self._on_cancel,
+        )
+
         # ── Results (hidden until done) ────────────────────────────────────
         self._results_frame = ctk.CTkFrame(scroll, fg_color="transparent")
 
@@ -344,6 +372,22 @@ class RedactorApp(ctk.CTk):
 
         self._start_redaction(input_path, terms, Path(out_str))
 
+    def _on_cancel(self) -> None:
+        if not self._is_running:
+            return
+        self._cancel_event.set()
+        self._cancel_btn.configure(state="disabled")
+        self._status_lbl.configure(text="Cancelling…", text_color=_MUTED)
+
+    def _on_close(self) -> None:
+        # Stop a running redaction first and close once the worker has
+        # returned; it checks for cancellation between pages.
+        if self._worker is not None and self._worker.is_alive():
+            self._cancel_event.set()
+            self.after(self._POLL_MS, self._on_close)
+            return
+        self.destroy()
+
     # ── Redaction ──────────────────────────────────────────────────────────────
 
     def _start_redaction(
@@ -355,39 +399,74 @@ class RedactorApp(ctk.CTk):
         self._progress.set(0)
         self._progress.configure(progress_color=_RED)
         self._status_lbl.configure(text="Starting…", text_color=_MUTED)
+        self._cancel_btn.configure(state="normal")
+        self._cancel_btn.pack(fill="x", padx=self._PAD, pady=(0, self._PAD))
         self._prog_frame.pack(fill="x")
+        self._progress_state = None
+        self._cancel_event = threading.Event()
 
-        threading.Thread(
+        self._worker = threading.Thread(
             target=self._run_thread,
-            args=(input_path, terms, output_path),
+            args=(input_path, terms, output_path, self._cancel_event),
             daemon=True,
-        ).start()
+        )
+        self._worker.start()
+        self._stop_polling()
+        self._poll_id = self.after(self._POLL_MS, self._poll_progress)
 
     def _run_thread(
-        self, input_path: Path, terms: list[str], output_path: Path
+        self,
+        input_path: Path,
+        terms: list[str],
+        output_path: Path,
+        cancel_event: threading.Event,
     ) -> None:
+        from pdf_redactor.redactor import RedactionCancelled, redact_pdf
+
         try:
             result = redact_pdf(
                 input_path=input_path,
                 terms=terms,
                 output_path=output_path,
-                progress_callback=lambda c, t: self.after(
-                    0, self._update_progress, c, t
-                ),
+                progress_callback=self._set_progress_state,
+                cancel_event=cancel_event,
             )
             self.after(0, self._on_complete, result)
+        except RedactionCancelled:
+            self.after(0, self._on_cancelled)
         except Exception as exc:
             self.after(0, self._on_error, exc)
 
-    def _update_progress(self, current: int, total: int) -> None:
-        self._progress.set(current / total)
-        self._status_lbl.configure(
-            text=f"Processing page {current} of {total}…"
-        )
+    def _set_progress_state(self, current: int, total: int) -> None:
+        # Runs on the worker thread: a plain attribute store, no Tk calls and
+        # no event queued per page.
+        self._progress_state = (current, total)
+
+    def _poll_progress(self) -> None:
+        self._poll_id = None
+        if not self._is_running:
+            return
+        state = self._progress_state
+        if state is not None:
+            current, total = state
+            self._progress_var.set(current / total)
+            # Keep "Cancelling…" up until the worker has actually stopped.
+            if not self._cancel_event.is_set():
+                self._status_lbl.configure(
+                    text=f"Processing page {current} of {total}…"
+                )
+        self._poll_id = self.after(self._POLL_MS, self._poll_progress)
+
+    def _stop_polling(self) -> None:
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
 
     def _on_complete(self, result: RedactionResult) -> None:
         self._is_running = False
+        self._stop_polling()
         self._redact_btn.configure(state="normal")
+        self._cancel_btn.pack_forget()
         self._progress.set(1.0)
         self._progress.configure(progress_color=_GREEN)
         self._status_lbl.configure(text="Complete", text_color=_GREEN)
@@ -428,9 +507,18 @@ class RedactorApp(ctk.CTk):
         self._saved_lbl.configure(text=f"Saved: {result.output_path}")
         self._results_frame.pack(fill="x")
 
+    def _on_cancelled(self) -> None:
+        self._is_running = False
+        self._stop_polling()
+        self._redact_btn.configure(state="normal")
+        self._cancel_btn.pack_forget()
+        self._status_lbl.configure(text="Cancelled — nothing was saved", text_color=_WARN)
+
     def _on_error(self, exc: Exception) -> None:
         self._is_running = False
+        self._stop_polling()
         self._redact_btn.configure(state="normal")
+        self._cancel_btn.pack_forget()
         self._status_lbl.configure(text=f"Error: {exc}", text_color="#e74c3c")
 
     # ── Helpers ────────────────────────────────────────────────────────────────
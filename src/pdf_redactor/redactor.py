@@ -8,17 +8,137 @@ from the document.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable, Iterator
 
 import fitz  # PyMuPDF
 
+from pdf_redactor.terms import parse_terms  # re-exported
+
+try:  # Optional C implementation of Aho-Corasick (``pip install pyahocorasick``).
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on the environment
+    ahocorasick = None
+
+try:  # Compiled scanner from _fastmatch.pyx, present when built with Cython.
+    from pdf_redactor import _fastmatch
+except ImportError:  # pragma: no cover - depends on the build
+    _fastmatch = None
+
+try:  # Optional, speeds up merging rects on pages with many matches.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 logger = logging.getLogger(__name__)
 
 # Default redaction fill color (black).
 DEFAULT_FILL_COLOR: tuple[float, float, float] = (0.0, 0.0, 0.0)
 
+# Rects whose top edges are within this many points share a text line, and
+# rects on one line closer than this horizontally are merged into one.
+_COALESCE_TOLERANCE = 1.0
+
+# Pages with at least this many match rects are coalesced with NumPy when it
+# is installed; below this the array setup costs more than the Python loop.
+_NUMPY_MIN_RECTS = 64
+
+# TextPage flags for every extraction, and for the ``search_for`` calls that
+# reuse its TextPage. They differ from ``search_for``'s own default
+# (TEXTFLAGS_SEARCH) in three ways:
+#   - no TEXT_DEHYPHENATE: joining hyphenated lines would break the
+#     one-box-per-character mapping in ``_page_chars``;
+#   - no TEXT_PRESERVE_LIGATURES: ligatures are expanded to their letters,
+#     so "ﬁ" is matched by a term containing "fi";
+#   - TEXT_CID_FOR_UNKNOWN_UNICODE: glyphs with no Unicode mapping keep a
+#     character (and its box) instead of being dropped.
+# Whitespace is kept and text is clipped to the mediabox as in the default;
+# images are not collected.
+_TEXTPAGE_FLAGS = (
+    fitz.TEXT_PRESERVE_WHITESPACE
+    | fitz.TEXT_MEDIABOX_CLIP
+    | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+)
+
+# Default number of pages whose extracted text is kept between runs.
+DEFAULT_PAGE_CACHE_SIZE = 64
+
+# Documents with fewer pages to scan than this are processed serially, as
+# starting worker processes would cost more than it saves.
+_MIN_PARALLEL_PAGES = 8
+
+# Pages are matched with one ``page.search_for`` call per term for up to this
+# many distinct terms; above it, one automaton scan over the page's
+# characters is faster despite their slow extraction.
+_SEARCH_FOR_MAX_TERMS = 16
+
+# How often, in seconds, a parallel search checks for cancellation while it
+# waits for its worker processes.
+_CANCEL_POLL_INTERVAL = 0.05
+
+# Most pages handed to a worker process at once. Small chunks keep workers
+# evenly loaded and bound the work a cancelled search throws away.
+_PARALLEL_CHUNK_PAGES = 16
+
+
+@dataclass
+class RedactOptions:
+    """Tuning options for ``redact_pdf`` that do not affect what is redacted.
+
+    Attributes:
+        page_cache_size: Number of pages whose extracted text is kept in
+            memory between calls, so re-running on an unchanged file (e.g.
+            with an adjusted term list) skips text extraction. Set to ``0``
+            to disable caching.
+
+            The cache is per process and holds the *unredacted* text of the
+            most recently searched pages until they are evicted or
+            ``clear_page_cache`` is called, so long-running processes
+            handling untrusted or sensitive documents should disable or
+            clear it.
+        workers: Number of processes used to search pages in parallel.
+            Defaults to ``1``, which searches serially in the calling
+            process; ``None`` uses ``os.cpu_count()``. Each worker is a fresh
+            "spawn" process that imports PyMuPDF, so this only pays off for
+            long documents with expensive pages, and scripts using it need
+            an ``if __name__ == "__main__":`` guard. Documents with fewer
+            than 8 uncached pages are always searched serially, and if the
+            pool breaks the remaining pages are searched serially too.
+        max_pages_in_memory: For very large PDFs, flush redacted pages to a
+            temporary working copy every this many pages and reopen it, so
+            pending changes do not accumulate in memory. The output is still
+            written as a single fully rewritten file. ``None`` keeps the
+            whole document in memory until it is saved.
+
+            The working copy starts as an unredacted duplicate of the input.
+            It is deleted when ``redact_pdf`` returns, but a crash or a
+            killed process can leave it behind in ``temp_dir``.
+        compress: Write the output with Flate compression of all streams
+            (including images and fonts), content stream cleanup, and
+            garbage collection that merges duplicate objects. This usually
+            makes the output smaller than the input, at some extra CPU cost.
+        temp_dir: Directory for the ``max_pages_in_memory`` working copy.
+            Defaults to ``tempfile.gettempdir()``, so no unredacted copy is
+            ever written next to the output, which may be on a shared drive.
+    """
+
+    page_cache_size: int = DEFAULT_PAGE_CACHE_SIZE
+    workers: int | None = 1
+    max_pages_in_memory: int | None = None
+    compress: bool = True
+    temp_dir: Path | None = None
+
 
 @dataclass
 class RedactionResult:
@@ -28,8 +148,11 @@ class RedactionResult:
         output_path: Where the redacted PDF was saved.
         total_matches: Total number of text matches redacted across all pages.
         matches_per_term: Count of matches found for each search term.
+            Overlapping matches of one term count once, as with
+            ``str.count``: "aa" occurs twice in "aaaaa", not four times.
         pages_modified: Number of pages that contained at least one match.
         pages_total: Total number of pages in the document.
+        terms_not_found: Search terms with no matches, in input order.
     """
 
     output_path: Path
@@ -37,30 +160,702 @@ class RedactionResult:
     matches_per_term: dict[str, int]
     pages_modified: int
     pages_total: int
-    terms_not_found: list[str] = field(default_factory=list)
+    terms_not_found: tuple[str, ...] = ()
+
+
+class RedactionCancelled(Exception):
+    """Raised by ``redact_pdf`` when its ``cancel_event`` is set.
+
+    No output file is written for a cancelled redaction.
+    """
+
+
+def _check_cancelled(cancel_event: threading.Event | None) -> None:
+    """Raise ``RedactionCancelled`` if ``cancel_event`` has been set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise RedactionCancelled("Redaction was cancelled.")
+
+
+def _is_word_char(char: str) -> bool:
+    """Return whether ``char`` can be part of a word, as in regex ``\\w``."""
+    return char.isalnum() or char == "_"
+
+
+def _fold(text: str) -> str:
+    """Lowercase ``text`` without changing its length.
+
+    Keeping one output character per input character lets match offsets in
+    the folded string index straight into the page's per-character boxes.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def _search_key(text: str) -> str:
+    """Fold ``text`` and collapse each run of whitespace to one space.
 
+    Terms and page text are compared in this form, so a phrase still matches
+    when the page breaks it across lines or spaces its words differently.
+    """
+    return _fold(" ".join(text.split()))
+
+
+class _TermAutomaton:
+    """Aho-Corasick automaton that finds every term in a single scan.
+
+    Uses ``pyahocorasick`` when it is installed. Otherwise the automaton is
+    built in Python and scanned by the compiled ``_fastmatch`` extension if
+    it was built, or in pure Python if not. Terms are matched by their
+    ``_search_key``, against text in the same form. Matching reports
+    overlapping matches, so "John" and "John Doe" are both found in
+    "John Doe".
+    """
+
+    def __init__(self, terms: list[str]) -> None:
+        term_keys = [_search_key(term) for term in terms]
+        self._lengths = [len(key) for key in term_keys]
+        # Whether each term starts / ends with a word character; only those
+        # edges need a boundary check when matching whole words.
+        self.word_edges = [
+            (_is_word_char(key[:1]), _is_word_char(key[-1:])) for key in term_keys
+        ]
+
+        # Terms that differ only in case or spacing share a key, so each key
+        # maps to every term index it stands for.
+        keys: dict[str, list[int]] = {}
+        for index, key in enumerate(term_keys):
+            if key:
+                keys.setdefault(key, []).append(index)
+        self.keys = keys
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for key, indices in keys.items():
+                self._automaton.add_word(key, tuple(indices))
+            self._automaton.make_automaton()
+            return
+
+        self._automaton = None
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[tuple[int, ...]] = [()]
+        for key, indices in keys.items():
+            state = 0
+            for ch in key:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append(())
+                state = nxt
+            self._out[state] += tuple(indices)
+
+        # Breadth-first pass computing failure links and merging the outputs
+        # of each state's failure target into its own.
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+        self._tables = self._compile_tables() if _fastmatch is not None else None
+
+    def _compile_tables(self) -> tuple:
+        """Flatten the automaton into the tables ``_fastmatch.scan`` takes."""
+        alphabet = {ch: i for i, ch in enumerate(sorted(set("".join(self.keys))), 1)}
+        cmap = array("i", bytes(4 * 65536))
+        wide: dict[int, int] = {}
+        for ch, cid in alphabet.items():
+            if ord(ch) < 65536:
+                cmap[ord(ch)] = cid
+            else:
+                wide[ord(ch)] = cid
+
+        edge_start, edge_char, edge_next = array("i", [0]), array("i"), array("i")
+        for goto in self._goto:
+            for cid, nxt in sorted((alphabet[ch], nxt) for ch, nxt in goto.items()):
+                edge_char.append(cid)
+                edge_next.append(nxt)
+            edge_start.append(len(edge_char))
+
+        out_start, out_index = array("i", [0]), array("i")
+        for out in self._out:
+            out_index.extend(out)
+            out_start.append(len(out_index))
+
+        return (
+            cmap,
+            wide,
+            edge_start,
+            edge_char,
+            edge_next,
+            array("i", self._fail),
+            out_start,
+            out_index,
+            array("i", self._lengths),
+        )
+
+    def occurs_in(self, text: str) -> bool:
+        """Return whether any term occurs in ``text`` (a ``_search_key``)."""
+        if self._automaton is not None:
+            if len(self._automaton) == 0:
+                return False
+            return next(self._automaton.iter(text), None) is not None
+        # One C-level substring search per term beats a Python-level scan.
+        return any(key in text for key in self.keys)
+
+    def find_all(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(start, end, term_index)`` for every match in ``text``.
+
+        ``text`` must already be in ``_search_key`` form; ``end`` is
+        exclusive.
+        """
+        lengths = self._lengths
+        if self._automaton is not None:
+            if len(self._automaton) == 0:
+                return
+            for last, indices in self._automaton.iter(text):
+                for index in indices:
+                    yield last + 1 - lengths[index], last + 1, index
+            return
+
+        if self._tables is not None:
+            yield from _fastmatch.scan(text, *self._tables)
+            return
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield pos + 1 - lengths[index], pos + 1, index
+
+
+class _PageTextCache:
+    """Thread-safe LRU cache of extracted page text, shared by all calls.
+
+    Keys include the source file's modification time, so entries for a file
+    that changed on disk are never returned.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: tuple) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._trim()
+
+    def peek(self, key: tuple) -> Any | None:
+        """Return the cached value for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._trim()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
-def parse_terms(raw_input: str) -> list[str]:
-    """Parse a raw string of redaction terms into a deduplicated list.
+    def _trim(self) -> None:
+        while len(self._entries) > max(self.maxsize, 0):
+            self._entries.popitem(last=False)
 
-    Terms can be separated by newlines or commas. Leading/trailing whitespace
-    is stripped from each term. Empty terms and duplicates are removed.
+
+_page_cache = _PageTextCache(DEFAULT_PAGE_CACHE_SIZE)
+
+
+def clear_page_cache() -> None:
+    """Drop all page text cached by earlier ``redact_pdf`` calls.
+
+    The cache holds unredacted text, so call this once a document no longer
+    needs to be re-run, e.g. after each job in a long-running server.
+    """
+    _page_cache.clear()
+
+# Box stored for the collapsed whitespace in ``_page_chars``. Its infinite
+# extent drops out of the min/max union taken over a match's boxes.
+_NO_BOX = (math.inf, math.inf, -math.inf, -math.inf)
+
+
+def _page_chars(
+    page: fitz.Page, textpage: fitz.TextPage | None = None
+) -> tuple[str, array, array]:
+    """Extract a page's text as one string with a bbox for every character.
+
+    The text is in ``_search_key`` form apart from case: every run of
+    whitespace, including the break between text lines, becomes one space.
+    Boxes are stored flat, four floats per character, to keep cached pages
+    small. The third item holds the offset where each text line starts.
+    """
+    chars: list[str] = []
+    boxes = array("d")
+    line_starts = array("i")
+    space = False
+    for block in page.get_text("rawdict", textpage=textpage)["blocks"]:
+        for line in block.get("lines", ()):
+            line_start = True
+            for span in line["spans"]:
+                for char in span["chars"]:
+                    c = char["c"]
+                    if c.isspace():
+                        space = bool(chars)
+                        continue
+                    if space:
+                        chars.append(" ")
+                        boxes.extend(_NO_BOX)
+                        space = False
+                    if line_start:
+                        line_starts.append(len(chars))
+                        line_start = False
+                    chars.append(c)
+                    boxes.extend(char["bbox"])
+            space = bool(chars)
+    return "".join(chars), boxes, line_starts
+
+
+def _find_matches(
+    page_chars: tuple[str, array, array],
+    automaton: _TermAutomaton,
+    whole_words: bool = False,
+) -> list[tuple[int, int, list[fitz.Rect]]]:
+    """Find every case-insensitive occurrence of the terms on a page.
 
     Args:
-        raw_input: Raw text containing terms separated by newlines or commas.
+        page_chars: Output of ``_page_chars`` for the page.
+        automaton: Automaton built from the terms to look for.
+        whole_words: Drop matches that start or end inside a word. As with
+            regex ``\\b``, the check only applies at term edges that are
+            word characters.
 
     Returns:
-        Ordered list of unique, non-empty terms.
+        A ``(term_index, count, rects)`` triple for every match, in page
+        order, with one rect for each text line the match covers. ``count``
+        is 0 for a match overlapping an earlier counted match of the same
+        term ("aa" twice in "aaa"), so terms are counted like ``str.count``.
     """
-    seen: set[str] = set()
-    terms: list[str] = []
-    for line in raw_input.splitlines():
-        for part in line.split(","):
-            term = part.strip()
-            if term and term not in seen:
-                seen.add(term)
-                terms.append(term)
-    return terms
+    text, boxes, line_starts = page_chars
+    matches: list[tuple[int, int, list[fitz.Rect]]] = []
+    # Local aliases: this loop runs once per match on every page.
+    append, is_word, Rect = matches.append, _is_word_char, fitz.Rect
+    word_edges = automaton.word_edges
+    size = len(text)
+    # End of the last counted match of each term; hits arrive in end order,
+    # which for one term is also start order.
+    counted_to: dict[int, int] = {}
+    for start, end, index in automaton.find_all(_fold(text)):
+        if whole_words:
+            check_start, check_end = word_edges[index]
+            if (check_start and start > 0 and is_word(text[start - 1])) or (
+                check_end and end < size and is_word(text[end])
+            ):
+                continue
+        # Split the match at line starts so a phrase wrapped onto the next
+        # line is covered line by line, not by one box spanning both.
+        first = bisect_right(line_starts, start)
+        last = bisect_right(line_starts, end - 1)
+        cuts = [start, *line_starts[first:last], end]
+        rects = []
+        for lo, hi in zip(cuts, cuts[1:]):
+            lo, hi = 4 * lo, 4 * hi
+            x0, x1 = min(boxes[lo:hi:4]), max(boxes[lo + 2:hi:4])
+            if x0 <= x1:  # skip pieces made only of collapsed whitespace
+                y0, y1 = min(boxes[lo + 1:hi:4]), max(boxes[lo + 3:hi:4])
+                rects.append(Rect(x0, y0, x1, y1))
+        if rects:
+            count = 1 if start >= counted_to.get(index, 0) else 0
+            if count:
+                counted_to[index] = end
+            append((index, count, rects))
+    return matches
+
+
+@dataclass
+class _PageText:
+    """Extracted text of one page, as stored in the page cache.
+
+    Attributes:
+        text: Plain page text from ``get_text("text")``, as a ``_search_key``,
+            or ``None`` if ``_search_page`` found no term and never needed it.
+        chars: Output of ``_page_chars``, or ``None`` if it was not needed,
+            because no term of the extracting run occurred in ``text`` or
+            ``_search_page`` located them.
+    """
+
+    text: str | None
+    chars: tuple[str, array, array] | None
+
+
+def _search_page(
+    page: fitz.Page,
+    textpage: fitz.TextPage,
+    text: str | None,
+    automaton: _TermAutomaton,
+) -> tuple[_PageText, list[tuple[int, int, list[fitz.Rect]]]] | None:
+    """Match the terms with ``page.search_for``, one call per term.
+
+    All calls share ``textpage``. MuPDF's search ignores case and matches a
+    space against any run of whitespace, as the character stream does. The
+    plain text is only extracted once a term is found, to count its
+    occurrences; if it is already known, terms absent from it are skipped.
+
+    Returns:
+        The page's ``_PageText`` and its matches in the form
+        ``_find_matches`` returns them, one entry per term. ``None`` if a term
+        occurs in the text but MuPDF found no rect for it; the caller then
+        falls back to the character walk.
+    """
+    found = []
+    for key, indices in automaton.keys.items():
+        if text is not None and key not in text:
+            continue
+        rects = page.search_for(key, textpage=textpage)
+        if rects:
+            found.append((key, indices, rects))
+        elif text is not None:
+            return None
+    if not found:
+        return _PageText(text, None), []
+
+    if text is None:
+        text = _search_key(page.get_text("text", textpage=textpage))
+        found_keys = {key for key, _, _ in found}
+        if any(key in text for key in automaton.keys if key not in found_keys):
+            return None
+    matches = [
+        (index, max(text.count(key), 1), rects)
+        for key, indices, rects in found
+        for index in indices
+    ]
+    return _PageText(text, None), matches
+
+
+def _match_page(
+    entry: _PageText | None,
+    load_page: Callable[[], fitz.Page],
+    automaton: _TermAutomaton,
+    whole_words: bool,
+) -> tuple[_PageText, list[tuple[int, int, list[fitz.Rect]]]]:
+    """Match all terms on one page, extracting its text as needed.
+
+    The page is laid out into a ``TextPage`` at most once, with
+    ``_TEXTPAGE_FLAGS``. Up to ``_SEARCH_FOR_MAX_TERMS`` terms are located
+    with MuPDF's own search (``_search_page``). More terms, or
+    ``whole_words``, use one automaton scan over the page's characters. That
+    path checks the cheap plain text for the terms first, so the much slower
+    character extraction, which is then cached, only runs on pages where
+    one occurs.
+
+    Args:
+        entry: The page's cached text, if any.
+        load_page: Returns the page; only called when text must be extracted.
+        automaton: Automaton built from the terms to look for.
+        whole_words: See ``_find_matches``.
+
+    Returns:
+        The page's (possibly updated) ``_PageText`` and its matches.
+    """
+    text = entry.text if entry is not None else None
+    if text is not None:
+        if entry.chars is not None:
+            return entry, _find_matches(entry.chars, automaton, whole_words)
+        if not automaton.occurs_in(text):
+            return entry, []
+
+    page = load_page()
+    textpage = page.get_textpage(flags=_TEXTPAGE_FLAGS)
+    if not whole_words and len(automaton.keys) <= _SEARCH_FOR_MAX_TERMS:
+        searched = _search_page(page, textpage, text, automaton)
+        if searched is not None:
+            return searched
+
+    if text is None:
+        text = _search_key(page.get_text("text", textpage=textpage))
+        if not automaton.occurs_in(text):
+            return _PageText(text, None), []
+    chars = _page_chars(page, textpage=textpage)
+    return _PageText(text, chars), _find_matches(chars, automaton, whole_words)
+
+
+# Automaton and ``whole_words`` flag of a worker process, set once by
+# ``_init_worker`` so chunks do not each rebuild (and re-send) the terms.
+_worker_state: tuple[_TermAutomaton, bool] | None = None
+
+
+def _init_worker(terms: list[str], whole_words: bool) -> None:
+    """Process-pool initializer: build the term automaton for ``_scan_pages``."""
+    global _worker_state
+    _worker_state = (_TermAutomaton(terms), whole_words)
+
+
+def _scan_pages(
+    path: str,
+    page_indices: list[int],
+    keep_text: bool,
+) -> list[tuple[int, _PageText | None, list[tuple[int, int, list[tuple[float, ...]]]]]]:
+    """Process-pool worker: search a range of pages of the PDF at ``path``.
+
+    Uses the automaton built by ``_init_worker``.
+
+    Returns:
+        ``(page_index, page_text, matches)`` for each page, where
+        ``page_text`` is the extracted text (or ``None`` unless
+        ``keep_text``) and ``matches`` holds ``(term_index, count, rects)``
+        triples with rects as plain tuples.
+    """
+    automaton, whole_words = _worker_state
+    results = []
+    doc = fitz.open(path)
+    try:
+        for page_index in page_indices:
+            page_text, found = _match_page(
+                None, lambda: doc[page_index], automaton, whole_words
+            )
+            matches = [
+                (index, count, [tuple(rect) for rect in rects])
+                for index, count, rects in found
+            ]
+            results.append((page_index, page_text if keep_text else None, matches))
+    finally:
+        doc.close()
+    return results
+
+
+def _scan_parallel(
+    path: Path,
+    page_indices: list[int],
+    terms: list[str],
+    whole_words: bool,
+    workers: int,
+    keep_text: bool,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[tuple[int, _PageText | None, list[tuple[int, int, list[tuple[float, ...]]]]]]:
+    """Search pages across worker processes, yielding results as they finish.
+
+    ``page_indices`` is split into contiguous chunks of at most
+    ``_PARALLEL_CHUNK_PAGES`` pages; for each chunk a worker opens its own
+    copy of the document and searches those pages. Each worker builds the
+    term automaton once, in ``_init_worker``, and reuses it for every chunk.
+
+    Raises:
+        RedactionCancelled: If ``cancel_event`` is set while waiting.
+    """
+    size = min(_PARALLEL_CHUNK_PAGES, math.ceil(len(page_indices) / workers))
+    chunks = [page_indices[i:i + size] for i in range(0, len(page_indices), size)]
+    # "spawn" avoids forking a parent that may be inside MuPDF on another thread.
+    context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(terms, whole_words),
+    )
+    try:
+        pending = {
+            pool.submit(_scan_pages, str(path), chunk, keep_text) for chunk in chunks
+        }
+        while pending:
+            done, pending = wait(
+                pending, timeout=_CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+            )
+            _check_cancelled(cancel_event)
+            for future in done:
+                yield from future.result()
+    except BaseException:
+        # Cancelled, failed or closed early: stop now rather than letting the
+        # workers finish their chunks (and the exit handler wait for them).
+        _terminate_pool(pool)
+        raise
+    pool.shutdown()
+
+
+def _terminate_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut ``pool`` down without waiting, killing workers still running."""
+    terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    # Earlier versions have no public way to stop a busy worker process.
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+def _iter_page_matches(
+    input_path: Path,
+    get_page: Callable[[int], fitz.Page],
+    total_pages: int,
+    terms: list[str],
+    whole_words: bool,
+    options: RedactOptions,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[tuple[int, list[tuple[int, int, list[Any]]]]]:
+    """Yield ``(page_index, matches)`` for every page of the document.
+
+    ``matches`` holds ``(term_index, count, rects)`` triples.
+
+    Uncached pages are searched in a process pool when there are enough of
+    them; all other pages are read from the page cache (or extracted) and
+    matched in this process, using ``get_page`` to load them.
+    """
+    automaton = _TermAutomaton(terms)
+    _page_cache.resize(options.page_cache_size)
+    # A file replaced in place can keep its mtime (coarse timestamps, copies
+    # that preserve it), so size, inode and ctime are part of the key too.
+    stat = input_path.stat()
+    source_key = (
+        str(input_path.resolve()),
+        stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_ctime_ns,
+    )
+    remaining: list[int] | range = range(total_pages)
+
+    uncached = [
+        i for i in range(total_pages) if (*source_key, i) not in _page_cache
+    ]
+    workers = options.workers if options.workers is not None else os.cpu_count()
+    workers = min(workers or 1, len(uncached))
+    if workers > 1 and len(uncached) >= _MIN_PARALLEL_PAGES:
+        logger.info("Searching %d pages with %d workers", len(uncached), workers)
+        keep_text = len(uncached) <= options.page_cache_size
+        searched: set[int] = set()
+        try:
+            for page_index, page_text, matches in _scan_parallel(
+                input_path, uncached, terms, whole_words, workers, keep_text,
+                cancel_event,
+            ):
+                if page_text is not None:
+                    _page_cache.put((*source_key, page_index), page_text)
+                searched.add(page_index)
+                yield page_index, matches
+        except BrokenProcessPool:
+            # E.g. a worker died, or the calling script has no main guard.
+            logger.warning(
+                "Worker processes failed; searching the remaining pages serially",
+                exc_info=True,
+            )
+        remaining = sorted(set(remaining).difference(searched))
+
+    for page_index in remaining:
+        key = (*source_key, page_index)
+        cached = _page_cache.peek(key)
+        page_text, matches = _match_page(
+            cached, lambda: get_page(page_index), automaton, whole_words
+        )
+        if page_text is not cached:
+            _page_cache.put(key, page_text)
+        yield page_index, matches
+
+
+def _coalesce_rects(
+    rects: list[Any], tolerance: float = _COALESCE_TOLERANCE
+) -> list[fitz.Rect]:
+    """Merge overlapping or touching rects that lie on the same text line.
+
+    Rects are grouped into lines by their top edge, then merged left to right
+    within each line. Rects on different lines are never merged, so the
+    result covers no text outside the original rects.
+    """
+    if np is not None and len(rects) >= _NUMPY_MIN_RECTS:
+        return _coalesce_rects_numpy(rects, tolerance)
+
+    ordered = sorted((fitz.Rect(r) for r in rects), key=lambda r: (r.y0, r.x0))
+    lines: list[list[fitz.Rect]] = []
+    last_y0 = -math.inf
+    for rect in ordered:
+        if rect.y0 - last_y0 > tolerance:
+            lines.append([])
+        lines[-1].append(rect)
+        last_y0 = rect.y0
+
+    merged: list[fitz.Rect] = []
+    for line in lines:
+        line.sort(key=lambda r: r.x0)
+        current = line[0]
+        for rect in line[1:]:
+            if rect.x0 <= current.x1 + tolerance:
+                current |= rect
+            else:
+                merged.append(current)
+                current = rect
+        merged.append(current)
+    return merged
+
+
+def _coalesce_rects_numpy(rects: list[Any], tolerance: float) -> list[fitz.Rect]:
+    """Vectorized ``_coalesce_rects`` for pages with many matches."""
+    arr = np.array([tuple(r) for r in rects], dtype=np.float64)
+
+    # Assign line ids in top-to-bottom order, then order by x within lines.
+    arr = arr[np.lexsort((arr[:, 0], arr[:, 1]))]
+    line = np.concatenate(([0], np.cumsum(np.diff(arr[:, 1]) > tolerance)))
+    order = np.lexsort((arr[:, 0], line))
+    arr, line = arr[order], line[order]
+
+    # Shifting each line right by more than the page width lets a single
+    # running maximum of x1 restart at every line.
+    shift = line * (arr[:, 2].max() - arr[:, 0].min() + 2 * tolerance + 1)
+    reach = np.maximum.accumulate(arr[:, 2] + shift)
+    starts = np.empty(len(arr), dtype=bool)
+    starts[0] = True
+    starts[1:] = (line[1:] != line[:-1]) | (arr[1:, 0] + shift[1:] > reach[:-1] + tolerance)
+    idx = np.flatnonzero(starts)
+
+    merged = np.column_stack((
+        np.minimum.reduceat(arr[:, 0], idx),
+        np.minimum.reduceat(arr[:, 1], idx),
+        np.maximum.reduceat(arr[:, 2], idx),
+        np.maximum.reduceat(arr[:, 3], idx),
+    ))
+    return [fitz.Rect(row) for row in merged.tolist()]
+
+
+def _apply_matches(
+    page: fitz.Page,
+    matches: list[tuple[int, int, list[Any]]],
+    fill_color: tuple[float, float, float],
+    counts: list[int],
+) -> bool:
+    """Redact ``matches`` on ``page``; return whether the page was modified.
+
+    ``matches`` holds ``(term_index, count, rects)`` triples. ``counts`` is
+    indexed by term and incremented by each match's ``count``.
+    Overlapping matches (e.g. "John" and "John Doe") are coalesced first, so
+    each area is annotated and redacted only once.
+    """
+    for index, count, _ in matches:
+        counts[index] += count
+    add_annot = page.add_redact_annot
+    for rect in _coalesce_rects([rect for *_, rects in matches for rect in rects]):
+        add_annot(rect, fill=fill_color)
+
+    if matches:
+        page.apply_redactions()
+    return bool(matches)
 
 
 def redact_pdf(
@@ -69,12 +864,23 @@ def redact_pdf(
     output_path: Path | None = None,
     fill_color: tuple[float, float, float] = DEFAULT_FILL_COLOR,
     progress_callback: Callable[[int, int], None] | None = None,
+    whole_words: bool = False,
+    options: RedactOptions | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> RedactionResult:
     """Search for and permanently redact all occurrences of terms in a PDF.
 
     Each match is covered with a filled rectangle and the underlying text is
     removed from the document. This operation is irreversible once saved.
 
+    Terms are matched case-insensitively anywhere in the page text, including
+    inside longer words. Runs of whitespace count as a single space, so a
+    phrase still matches when it wraps onto the next line. Each page's text
+    is extracted once and scanned for all terms together. With
+    ``options.workers`` above 1, larger documents are searched in parallel
+    worker processes; the redactions themselves are always applied in the
+    calling process.
+
     Args:
         input_path: Path to the source PDF file.
         terms: List of text strings to search for and redact.
@@ -82,8 +888,16 @@ def redact_pdf(
             ``<original_stem>_redacted.pdf`` in the same directory.
         fill_color: RGB fill color for redaction boxes, each component 0.0-1.0.
             Defaults to black ``(0, 0, 0)``.
-        progress_callback: Optional callable invoked after each page is
-            processed, receiving ``(current_page, total_pages)`` (1-indexed).
+        progress_callback: Optional callable receiving
+            ``(pages_done, total_pages)`` as pages are processed: after every
+            page for documents up to 100 pages, and about 100 times in total
+            for longer ones, always including the final page. Pages may
+            complete out of order when searched in parallel.
+        whole_words: Only match terms that are not part of a longer word,
+            e.g. "secret" in "secret," but not in "secrets".
+        options: Performance tuning; see ``RedactOptions``.
+        cancel_event: Optional event that another thread can set to stop the
+            redaction. It is checked between pages.
 
     Returns:
         A ``RedactionResult`` summarizing what was redacted and where the
@@ -94,6 +908,8 @@ def redact_pdf(
         ValueError: If ``terms`` is empty.
         fitz.FileDataError: If the file is not a valid PDF.
         PermissionError: If the output file cannot be written.
+        RedactionCancelled: If ``cancel_event`` is set before the output is
+            saved. Nothing is written to ``output_path``.
     """
     input_path = Path(input_path)
     if not input_path.exists():
@@ -104,40 +920,78 @@ def redact_pdf(
     if output_path is None:
         output_path = input_path.with_name(f"{input_path.stem}_redacted.pdf")
     output_path = Path(output_path)
+    if options is None:
+        options = RedactOptions()
 
-    matches_per_term: dict[str, int] = {term: 0 for term in terms}
+    # Match counts indexed like ``terms``; turned into a dict at the end.
+    counts = [0] * len(terms)
     pages_modified = 0
 
     logger.info("Opening PDF: %s (%d terms to redact)", input_path, len(terms))
 
     doc: fitz.Document = fitz.open(input_path)
+    work_path: Path | None = None
     try:
         total_pages = len(doc)
-
-        for page_index, page in enumerate(doc):
-            page_had_matches = False
-            for term in terms:
-                rects = page.search_for(term)
-                if rects:
-                    page_had_matches = True
-                    matches_per_term[term] += len(rects)
-                    for rect in rects:
-                        page.add_redact_annot(rect, fill=fill_color)
-
-            if page_had_matches:
-                page.apply_redactions()
+        flush_every = options.max_pages_in_memory
+        if flush_every:
+            # Incremental saves need a clean, unrepaired file to append to.
+            fd, name = tempfile.mkstemp(
+                prefix="pdf_redactor-", suffix=".pdf", dir=options.temp_dir
+            )
+            os.close(fd)
+            work_path = Path(name)
+            doc.save(str(work_path))
+            doc.close()
+            doc = fitz.open(work_path)
+
+        pages_done = 0
+        # Report progress about 100 times per document rather than per page.
+        progress_step = max(1, total_pages // 100)
+        for page_index, matches in _iter_page_matches(
+            input_path, lambda i: doc[i], total_pages, terms, whole_words, options,
+            cancel_event,
+        ):
+            _check_cancelled(cancel_event)
+            # Pages without matches are never loaded here.
+            if matches and _apply_matches(
+                doc[page_index], matches, fill_color, counts
+            ):
                 pages_modified += 1
-
-            if progress_callback is not None:
-                progress_callback(page_index + 1, total_pages)
-
-        doc.save(str(output_path))
+            pages_done += 1
+            if flush_every and pages_done % flush_every == 0 and pages_done < total_pages:
+                doc.saveIncr()
+                doc.close()
+                doc = fitz.open(work_path)
+            if progress_callback is not None and (
+                pages_done % progress_step == 0 or pages_done == total_pages
+            ):
+                progress_callback(pages_done, total_pages)
+        _check_cancelled(cancel_event)
+
+        save_kwargs: dict[str, Any] = {}
+        if options.compress:
+            save_kwargs = dict(
+                garbage=4,
+                deflate=True,
+                deflate_images=True,
+                deflate_fonts=True,
+                clean=True,
+            )
+        elif work_path is not None:
+            # A full rewrite drops the earlier revisions appended by
+            # saveIncr(), which still contain the unredacted content.
+            save_kwargs = dict(garbage=1)
+        doc.save(str(output_path), **save_kwargs)
         logger.info("Saved redacted PDF: %s", output_path)
     finally:
         doc.close()
+        if work_path is not None:
+            work_path.unlink(missing_ok=True)
 
-    total_matches = sum(matches_per_term.values())
-    terms_not_found = [t for t, count in matches_per_term.items() if count == 0]
+    matches_per_term = dict(zip(terms, counts))
+    total_matches = sum(counts)
+    terms_not_found = tuple(t for t, count in zip(terms, counts) if count == 0)
 
     if terms_not_found:
         logger.warning("Terms with no matches: %s", terms_not_found)
@@ -0,0 +1,29 @@
+"""Parsing of user-entered redaction terms.
+
+Kept free of PyMuPDF so the GUIs can validate input without loading the
+engine.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Separators accepted between terms: commas and every line boundary that
+# ``str.splitlines`` recognises.
+_TERM_SEPARATORS = re.compile(r"[,\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+")
+
+
+def parse_terms(raw_input: str) -> list[str]:
+    """Parse a raw string of redaction terms into a deduplicated list.
+
+    Terms can be separated by newlines or commas. Leading/trailing whitespace
+    is stripped from each term. Empty terms and duplicates are removed.
+
+    Args:
+        raw_input: Raw text containing terms separated by newlines or commas.
+
+    Returns:
+        Ordered list of unique, non-empty terms.
+    """
+    parts = (part.strip() for part in _TERM_SEPARATORS.split(raw_input))
+    return list(dict.fromkeys(filter(None, parts)))
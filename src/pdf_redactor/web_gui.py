@@ -18,7 +18,8 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-from pdf_redactor.redactor import parse_terms, redact_pdf
+from pdf_redactor.redactor import RedactOptions, redact_pdf
+from pdf_redactor.terms import parse_terms
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Job registry
@@ -208,6 +209,9 @@ class _Handler(BaseHTTPRequestHandler):
                     terms=terms,
                     output_path=output_path,
                     progress_callback=cb,
+                    # Every upload is a new file, so caching its text would
+                    # only keep unredacted content alive in the server.
+                    options=RedactOptions(page_cache_size=0),
                 )
                 _update_job(
                     jid,
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import os
+import random
+import subprocess
+import sys
+import threading
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import fitz  # PyMuPDF
 import pytest
 
-from pdf_redactor.redactor import RedactionResult, parse_terms, redact_pdf
+from pdf_redactor import redactor
+from pdf_redactor.redactor import (
+    RedactionCancelled,
+    RedactionResult,
+    RedactOptions,
+    parse_terms,
+    redact_pdf,
+)
 
 
 # ------------------------------------------------------------------
@@ -15,6 +28,11 @@ from pdf_redactor.redactor import RedactionResult, parse_terms, redact_pdf
 # ------------------------------------------------------------------
 
 
+def _search_text(text: str) -> str:
+    """Lowercase ``text`` and collapse its whitespace, as terms are matched."""
+    return " ".join(text.lower().split())
+
+
 def _create_test_pdf(path: Path, pages: list[str]) -> Path:
     """Create a minimal PDF with the given text on each page."""
     doc = fitz.open()
@@ -41,6 +59,9 @@ class TestParseTerms:
     def test_mixed_separators(self) -> None:
         assert parse_terms("foo, bar\nbaz, qux") == ["foo", "bar", "baz", "qux"]
 
+    def test_windows_line_endings(self) -> None:
+        assert parse_terms("foo\r\nbar\r\nbaz") == ["foo", "bar", "baz"]
+
     def test_strips_whitespace(self) -> None:
         assert parse_terms("  foo  ,  bar  ") == ["foo", "bar"]
 
@@ -60,6 +81,95 @@ class TestParseTerms:
         assert parse_terms("   \n  \n  ") == []
 
 
+# ------------------------------------------------------------------
+# _TermAutomaton
+# ------------------------------------------------------------------
+
+
+class TestTermAutomaton:
+    @pytest.mark.parametrize("backend", ["pyahocorasick", "fastmatch", "python"])
+    def test_backends_find_every_match(
+        self, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if backend == "pyahocorasick":
+            if redactor.ahocorasick is None:
+                pytest.skip("pyahocorasick not installed")
+        else:
+            monkeypatch.setattr(redactor, "ahocorasick", None)
+            if backend == "fastmatch":
+                if redactor._fastmatch is None:
+                    pytest.skip("_fastmatch extension not built")
+            else:
+                monkeypatch.setattr(redactor, "_fastmatch", None)
+
+        rng = random.Random(11)
+        for _ in range(200):
+            terms = [
+                "".join(rng.choice("abé\U0001f600") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            text = "".join(rng.choice("abAB é\U0001f600") for _ in range(40)).lower()
+            expected = sorted(
+                (i, i + len(term), k)
+                for k, term in enumerate(terms)
+                for i in range(len(text))
+                if text.startswith(term, i)
+            )
+
+            automaton = redactor._TermAutomaton(terms)
+            assert sorted(automaton.find_all(text)) == expected
+
+
+# ------------------------------------------------------------------
+# _coalesce_rects
+# ------------------------------------------------------------------
+
+
+class TestCoalesceRects:
+    def test_merges_overlapping_rects(self) -> None:
+        rects = [(10, 10, 40, 20), (30, 10, 60, 20), (10, 10, 20, 20)]
+        assert redactor._coalesce_rects(rects) == [fitz.Rect(10, 10, 60, 20)]
+
+    def test_merges_touching_rects(self) -> None:
+        rects = [(40.5, 10.2, 60, 20), (10, 10, 40, 20)]
+        assert redactor._coalesce_rects(rects) == [fitz.Rect(10, 10, 60, 20)]
+
+    def test_keeps_separate_rects_apart(self) -> None:
+        rects = [(50, 10, 60, 20), (10, 10, 20, 20)]
+        assert redactor._coalesce_rects(rects) == [
+            fitz.Rect(10, 10, 20, 20),
+            fitz.Rect(50, 10, 60, 20),
+        ]
+
+    def test_never_merges_across_lines(self) -> None:
+        rects = [(10, 10, 40, 22), (10, 20, 40, 32)]
+        assert redactor._coalesce_rects(rects) == [
+            fitz.Rect(10, 10, 40, 22),
+            fitz.Rect(10, 20, 40, 32),
+        ]
+
+    def test_empty(self) -> None:
+        assert redactor._coalesce_rects([]) == []
+
+    def test_numpy_matches_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        rng = random.Random(7)
+        rects = []
+        for _ in range(500):
+            x0 = rng.uniform(0, 550)
+            y0 = rng.choice([100, 100.4, 120, 140, 160.9, 161.5])
+            rects.append(fitz.Rect(x0, y0, x0 + rng.uniform(1, 40), y0 + 12))
+
+        vectorized = redactor._coalesce_rects(rects)
+        monkeypatch.setattr(redactor, "np", None)
+        swept = redactor._coalesce_rects(rects)
+
+        # MuPDF unions rects in single precision, so compare approximately.
+        assert len(vectorized) == len(swept)
+        for a, b in zip(vectorized, swept):
+            assert tuple(a) == pytest.approx(tuple(b), abs=1e-3)
+
+
 # ------------------------------------------------------------------
 # redact_pdf
 # ------------------------------------------------------------------
@@ -75,7 +185,7 @@ class TestRedactPdf:
         assert result.pages_modified == 1
         assert result.pages_total == 1
         assert result.output_path.exists()
-        assert result.terms_not_found == []
+        assert result.terms_not_found == ()
 
     def test_multiple_terms(self, tmp_path: Path) -> None:
         pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret world confidential data"])
@@ -86,13 +196,130 @@ class TestRedactPdf:
         assert result.matches_per_term["confidential"] == 1
         assert result.pages_modified == 1
 
+    def test_case_insensitive(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello SECRET world"])
+        result = redact_pdf(pdf_path, ["secret"])
+
+        assert result.matches_per_term == {"secret": 1}
+
+    def test_ignores_surrounding_punctuation(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["It is (secret), really."])
+        result = redact_pdf(pdf_path, ["secret", "really"])
+
+        assert result.matches_per_term == {"secret": 1, "really": 1}
+
+    def test_multi_word_term(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(
+            tmp_path / "test.pdf", ["Call John Doe, not John Smith"]
+        )
+        result = redact_pdf(pdf_path, ["John Doe"])
+
+        assert result.matches_per_term == {"John Doe": 1}
+
+        doc = fitz.open(str(result.output_path))
+        page_text = doc[0].get_text()
+        doc.close()
+
+        assert "Doe" not in page_text
+        assert "John Smith" in page_text
+
+    def test_multi_word_term_wrapped_across_lines(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(
+            tmp_path / "test.pdf", ["Hello there John\nDoe was here"]
+        )
+        result = redact_pdf(pdf_path, ["John Doe"])
+
+        assert result.matches_per_term == {"John Doe": 1}
+
+        doc = fitz.open(str(result.output_path))
+        page_text = doc[0].get_text()
+        doc.close()
+
+        assert "John" not in page_text
+        assert "Doe" not in page_text
+        # Each line is redacted separately, not with one box covering both.
+        assert "Hello there" in page_text
+        assert "was here" in page_text
+
+    def test_multi_word_term_ignores_spacing(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(
+            tmp_path / "test.pdf", ["Call John  Doe or Jane Roe"]
+        )
+        result = redact_pdf(pdf_path, ["John Doe", "Jane   Roe"])
+
+        assert result.matches_per_term == {"John Doe": 1, "Jane   Roe": 1}
+
+        doc = fitz.open(str(result.output_path))
+        page_text = doc[0].get_text()
+        doc.close()
+
+        assert "Doe" not in page_text
+        assert "Roe" not in page_text
+
+    def test_matches_inside_words(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Top secrets inside"])
+        result = redact_pdf(pdf_path, ["secret"])
+
+        assert result.matches_per_term == {"secret": 1}
+
+    def test_overlapping_matches_of_one_term_count_once(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["aaaaa 0000000 end"])
+        result = redact_pdf(pdf_path, ["aa", "00"])
+
+        assert result.matches_per_term == {"aa": 2, "00": 3}
+
+        doc = fitz.open(str(result.output_path))
+        page_text = doc[0].get_text()
+        doc.close()
+
+        assert "aa" not in page_text
+        assert "00" not in page_text
+
+    def test_whole_words(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Top secrets, secret."])
+        result = redact_pdf(pdf_path, ["secret"], whole_words=True)
+
+        assert result.matches_per_term == {"secret": 1}
+
+        doc = fitz.open(str(result.output_path))
+        page_text = doc[0].get_text()
+        doc.close()
+
+        assert "secrets" in page_text
+
+    def test_whole_words_phrase(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(
+            tmp_path / "test.pdf", ["John Doe, John Doerr and @acme"]
+        )
+        result = redact_pdf(pdf_path, ["John Doe", "@acme"], whole_words=True)
+
+        assert result.matches_per_term == {"John Doe": 1, "@acme": 1}
+
+    def test_overlapping_terms(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Call John Doe now"])
+        result = redact_pdf(pdf_path, ["John", "John Doe", "Doe"])
+
+        assert result.matches_per_term == {"John": 1, "John Doe": 1, "Doe": 1}
+
+    def test_without_pyahocorasick(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(redactor, "ahocorasick", None)
+        pdf_path = _create_test_pdf(
+            tmp_path / "test.pdf", ["she sells sea shells", "HERS and his"]
+        )
+        result = redact_pdf(pdf_path, ["he", "she", "his", "hers"])
+
+        assert result.matches_per_term == {"he": 3, "she": 2, "his": 1, "hers": 1}
+        assert result.pages_modified == 2
+
     def test_no_matches(self, tmp_path: Path) -> None:
         pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello world"])
         result = redact_pdf(pdf_path, ["missing"])
 
         assert result.total_matches == 0
         assert result.pages_modified == 0
-        assert result.terms_not_found == ["missing"]
+        assert result.terms_not_found == ("missing",)
 
     def test_multiple_pages(self, tmp_path: Path) -> None:
         pdf_path = _create_test_pdf(
@@ -130,6 +357,21 @@ class TestRedactPdf:
         assert calls == [(1, 3), (2, 3), (3, 3)]
         assert result.pages_total == 3
 
+    def test_progress_callback_is_throttled(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["page"] * 250)
+
+        calls: list[tuple[int, int]] = []
+        redact_pdf(
+            pdf_path,
+            ["missing"],
+            progress_callback=lambda cur, tot: calls.append((cur, tot)),
+            options=RedactOptions(workers=1),
+        )
+
+        assert calls[0] == (2, 250)
+        assert calls[-1] == (250, 250)
+        assert len(calls) == 125
+
     def test_file_not_found_raises(self, tmp_path: Path) -> None:
         with pytest.raises(FileNotFoundError):
             redact_pdf(tmp_path / "nonexistent.pdf", ["term"])
@@ -139,6 +381,316 @@ class TestRedactPdf:
         with pytest.raises(ValueError, match="(?i)at least one"):
             redact_pdf(pdf_path, [])
 
+    def test_rerun_reuses_cached_page_text(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret", "world"])
+        calls: list[int] = []
+        extract = redactor._page_chars
+        # Always take the character-walk path, which is the one cached.
+        monkeypatch.setattr(redactor, "_SEARCH_FOR_MAX_TERMS", 0)
+        monkeypatch.setattr(
+            redactor,
+            "_page_chars",
+            lambda page, **kw: calls.append(page.number) or extract(page, **kw),
+        )
+
+        redact_pdf(pdf_path, ["secret"])
+        result = redact_pdf(pdf_path, ["world"])
+
+        assert calls == [0, 1]
+        assert result.matches_per_term == {"world": 1}
+
+    def test_skips_character_walk_on_pages_without_terms(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["clean", "secret", "clean"])
+        calls: list[int] = []
+        extract = redactor._page_chars
+        # Always take the character-walk path, which is the one cached.
+        monkeypatch.setattr(redactor, "_SEARCH_FOR_MAX_TERMS", 0)
+        monkeypatch.setattr(
+            redactor,
+            "_page_chars",
+            lambda page, **kw: calls.append(page.number) or extract(page, **kw),
+        )
+
+        result = redact_pdf(pdf_path, ["secret"], options=RedactOptions(page_cache_size=0))
+
+        assert calls == [1]
+        assert result.pages_modified == 1
+
+    @pytest.mark.parametrize(
+        ("lines", "terms"),
+        [
+            (["Call John Doe, not John Smith"], ["John Doe", "smith"]),
+            (["Hello there John", "Doe was here"], ["John Doe"]),
+            (["Call John  Doe or Jane Roe"], ["John Doe", "Jane   Roe"]),
+            (["AAAAA 0000000 end", "Top secrets inside"], ["aa", "00", "secret"]),
+        ],
+    )
+    def test_search_for_path_matches_character_walk(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        lines: list[str],
+        terms: list[str],
+    ) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["\n".join(lines)])
+        options = RedactOptions(page_cache_size=0)
+
+        results = []
+        for limit in (0, redactor._SEARCH_FOR_MAX_TERMS):
+            monkeypatch.setattr(redactor, "_SEARCH_FOR_MAX_TERMS", limit)
+            result = redact_pdf(
+                pdf_path, terms, output_path=tmp_path / f"out{limit}.pdf", options=options
+            )
+            doc = fitz.open(str(result.output_path))
+            page_text = _search_text(doc[0].get_text())
+            doc.close()
+            assert not any(" ".join(t.lower().split()) in page_text for t in terms)
+            results.append(result.matches_per_term)
+
+        assert results[0] == results[1]
+
+    def test_cache_invalidated_when_file_changes(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret"])
+        redact_pdf(pdf_path, ["secret"])
+
+        _create_test_pdf(pdf_path, ["Hello world"])
+        stat = pdf_path.stat()
+        os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        result = redact_pdf(pdf_path, ["secret"])
+
+        assert result.total_matches == 0
+
+    def test_cache_invalidated_when_file_replaced_with_same_mtime(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(redactor, "_SEARCH_FOR_MAX_TERMS", 0)
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret"])
+        stat = pdf_path.stat()
+        redact_pdf(pdf_path, ["secret"])
+
+        _create_test_pdf(pdf_path, ["Hello world, nothing to see"])
+        os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        result = redact_pdf(pdf_path, ["secret"])
+
+        assert result.total_matches == 0
+
+    def test_clear_page_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret"])
+        calls: list[int] = []
+        extract = redactor._page_chars
+        monkeypatch.setattr(redactor, "_SEARCH_FOR_MAX_TERMS", 0)
+        monkeypatch.setattr(
+            redactor,
+            "_page_chars",
+            lambda page, **kw: calls.append(page.number) or extract(page, **kw),
+        )
+
+        redact_pdf(pdf_path, ["secret"])
+        redactor.clear_page_cache()
+        redact_pdf(pdf_path, ["secret"])
+
+        assert calls == [0, 0]
+
+    def test_page_cache_disabled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret"])
+        calls: list[int] = []
+        extract = redactor._page_chars
+        # Always take the character-walk path, which is the one cached.
+        monkeypatch.setattr(redactor, "_SEARCH_FOR_MAX_TERMS", 0)
+        monkeypatch.setattr(
+            redactor,
+            "_page_chars",
+            lambda page, **kw: calls.append(page.number) or extract(page, **kw),
+        )
+
+        options = RedactOptions(page_cache_size=0)
+        redact_pdf(pdf_path, ["secret"], options=options)
+        redact_pdf(pdf_path, ["secret"], options=options)
+
+        assert calls == [0, 0]
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        pages = [f"Page {i} secret" if i % 3 else f"Page {i} clean" for i in range(12)]
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", pages)
+
+        calls: list[tuple[int, int]] = []
+        parallel = redact_pdf(
+            pdf_path,
+            ["secret", "page"],
+            output_path=tmp_path / "parallel.pdf",
+            progress_callback=lambda cur, tot: calls.append((cur, tot)),
+            options=RedactOptions(workers=2, page_cache_size=0),
+        )
+        serial = redact_pdf(
+            pdf_path,
+            ["secret", "page"],
+            output_path=tmp_path / "serial.pdf",
+            options=RedactOptions(workers=1, page_cache_size=0),
+        )
+
+        assert parallel.matches_per_term == serial.matches_per_term == {"secret": 8, "page": 12}
+        assert parallel.pages_modified == serial.pages_modified == 12
+        assert calls[-1] == (12, 12)
+
+        doc = fitz.open(str(parallel.output_path))
+        page_text = "".join(page.get_text() for page in doc)
+        doc.close()
+
+        assert "secret" not in page_text
+        assert "clean" in page_text
+
+    def test_broken_pool_falls_back_to_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["secret"] * 12)
+
+        def broken_scan(path, pages, terms, whole_words, workers, keep_text, *_):
+            redactor._init_worker(terms, whole_words)
+            yield from redactor._scan_pages(str(path), pages[:3], keep_text)
+            raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr(redactor, "_worker_state", None)
+
+        monkeypatch.setattr(redactor, "_scan_parallel", broken_scan)
+        result = redact_pdf(
+            pdf_path, ["secret"], options=RedactOptions(workers=2, page_cache_size=0)
+        )
+
+        assert result.matches_per_term == {"secret": 12}
+        assert result.pages_modified == 12
+
+    def test_max_pages_in_memory(self, tmp_path: Path) -> None:
+        pages = [f"Page {i} secret" for i in range(5)]
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", pages)
+        output = tmp_path / "out" / "redacted.pdf"
+        output.parent.mkdir()
+
+        calls: list[tuple[int, int]] = []
+        result = redact_pdf(
+            pdf_path,
+            ["secret"],
+            output_path=output,
+            progress_callback=lambda cur, tot: calls.append((cur, tot)),
+            options=RedactOptions(max_pages_in_memory=2, workers=1),
+        )
+
+        assert result.matches_per_term == {"secret": 5}
+        assert result.pages_modified == 5
+        assert calls == [(i, 5) for i in range(1, 6)]
+        assert list(output.parent.iterdir()) == [output]
+
+        doc = fitz.open(str(output))
+        page_text = "".join(page.get_text() for page in doc)
+        version_count = doc.version_count
+        doc.close()
+
+        assert "secret" not in page_text
+        assert "Page 4" in page_text
+        # No incremental revisions holding the original text may survive.
+        assert version_count == 1
+
+    def test_working_copy_kept_out_of_output_dir(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["secret"] * 4)
+        output = tmp_path / "out" / "redacted.pdf"
+        output.parent.mkdir()
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        seen: list[tuple[list[str], list[str]]] = []
+        redact_pdf(
+            pdf_path,
+            ["secret"],
+            output_path=output,
+            progress_callback=lambda cur, tot: seen.append(
+                (os.listdir(output.parent), os.listdir(work_dir))
+            ),
+            options=RedactOptions(max_pages_in_memory=2, temp_dir=work_dir),
+        )
+
+        assert all(out == [] and len(work) == 1 for out, work in seen)
+        assert list(work_dir.iterdir()) == []
+
+    def test_compress(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(
+            tmp_path / "test.pdf", ["Hello secret world " * 3] * 4
+        )
+        compressed = redact_pdf(
+            pdf_path, ["secret"], output_path=tmp_path / "compressed.pdf"
+        )
+        plain = redact_pdf(
+            pdf_path,
+            ["secret"],
+            output_path=tmp_path / "plain.pdf",
+            options=RedactOptions(compress=False),
+        )
+
+        assert compressed.matches_per_term == plain.matches_per_term == {"secret": 12}
+        assert compressed.output_path.stat().st_size < plain.output_path.stat().st_size
+
+    def test_max_pages_in_memory_uncompressed(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["secret"] * 3)
+        result = redact_pdf(
+            pdf_path,
+            ["secret"],
+            options=RedactOptions(max_pages_in_memory=1, compress=False, workers=1),
+        )
+
+        doc = fitz.open(str(result.output_path))
+        version_count = doc.version_count
+        doc.close()
+
+        assert version_count == 1
+
+    def test_cancel_event(self, tmp_path: Path) -> None:
+        pages = [f"Page {i} secret" for i in range(5)]
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", pages)
+        output = tmp_path / "out" / "redacted.pdf"
+        output.parent.mkdir()
+        cancel = threading.Event()
+
+        calls: list[tuple[int, int]] = []
+
+        def progress(cur: int, tot: int) -> None:
+            calls.append((cur, tot))
+            if cur == 2:
+                cancel.set()
+
+        with pytest.raises(RedactionCancelled):
+            redact_pdf(
+                pdf_path,
+                ["secret"],
+                output_path=output,
+                progress_callback=progress,
+                options=RedactOptions(max_pages_in_memory=1, workers=1),
+                cancel_event=cancel,
+            )
+
+        assert calls == [(1, 5), (2, 5)]
+        assert list(output.parent.iterdir()) == []
+
+    def test_cancel_event_parallel(self, tmp_path: Path) -> None:
+        pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["secret"] * 12)
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(RedactionCancelled):
+            redact_pdf(
+                pdf_path,
+                ["secret"],
+                options=RedactOptions(workers=2, page_cache_size=0),
+                cancel_event=cancel,
+            )
+
+        assert not (tmp_path / "test_redacted.pdf").exists()
+
     def test_redacted_text_is_removed(self, tmp_path: Path) -> None:
         """Verify the redacted text is actually gone from the output PDF."""
         pdf_path = _create_test_pdf(tmp_path / "test.pdf", ["Hello secret world"])
@@ -150,3 +702,42 @@ class TestRedactPdf:
 
         assert "secret" not in page_text
         assert "Hello" in page_text
+
+
+# ------------------------------------------------------------------
+# Package
+# ------------------------------------------------------------------
+
+
+class TestPackage:
+    def test_import_defers_pymupdf(self) -> None:
+        code = (
+            "import sys, pdf_redactor; "
+            "assert 'fitz' not in sys.modules and 'pymupdf' not in sys.modules; "
+            "pdf_redactor.redact_pdf; "
+            "assert 'pymupdf' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_parse_terms_does_not_load_pymupdf(self) -> None:
+        code = (
+            "import sys, pdf_redactor; "
+            "assert pdf_redactor.parse_terms('a, b') == ['a', 'b']; "
+            "assert 'fitz' not in sys.modules and 'pymupdf' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self) -> None:
+        import pdf_redactor
+
+        with pytest.raises(AttributeError):
+            pdf_redactor.does_not_exist  # noqa: B018
+
+    def test_dir_lists_each_name_once(self) -> None:
+        import pdf_redactor
+
+        pdf_redactor.redact_pdf  # noqa: B018 - caches the name in globals()
+        names = dir(pdf_redactor)
+
+        assert len(names) == len(set(names))
+        assert set(pdf_redactor.__all__) <= set(names)